@@ -3,9 +3,9 @@
 Command-line interface for File2JSON converter.
 """
 
+import os
 import sys
 import argparse
-from pathlib import Path
 
 from file2json.converter import read_file, convert_to_json
 
@@ -25,20 +25,29 @@ def main():
         choices=['excel', 'csv', 'tsv', 'json', 'text'],
         help='Force file type instead of auto-detection'
     )
+    parser.add_argument(
+        '-b', '--backend',
+        choices=['polars'],
+        help='Fast reader for CSV/TSV files (used if installed)'
+    )
+    parser.add_argument(
+        '-c', '--compact',
+        action='store_true',
+        help='Write compact JSON without indentation'
+    )
     
     args = parser.parse_args()
     
     try:
         # Read the file
-        data = read_file(args.file_path, args.type)
+        data = read_file(args.file_path, args.type, backend=args.backend)
         
         # Set default output path if not specified
         if not args.output:
-            input_path = Path(args.file_path)
-            args.output = str(input_path.with_suffix('.json'))
+            args.output = os.path.splitext(args.file_path)[0] + '.json'
         
         # Convert and save
-        result = convert_to_json(data, args.output)
+        result = convert_to_json(data, args.output, compact=args.compact)
         print(result)
         
     except Exception as e:
@@ -4,9 +4,449 @@ Handles detection, reading, and conversion of various file formats to JSON.
 """
 
 import os
-import json
-import pandas as pd
-from typing import Dict, List, Union, Optional, Any
+import csv
+import mmap
+import stat
+import zipfile
+import orjson
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple, Union, Optional, Any
+
+# pandas, pyarrow and openpyxl are slow to import, so they are imported
+# only in the code paths that need them
+if TYPE_CHECKING:
+    import pandas as pd
+
+# File type for each recognised file extension
+_EXTENSION_TYPES = {
+    '.xlsx': 'excel',
+    '.xls': 'excel',
+    '.xlsm': 'excel',
+    '.xlsb': 'excel',
+    '.odf': 'excel',
+    '.ods': 'excel',
+    '.odt': 'excel',
+    '.csv': 'csv',
+    '.tsv': 'tsv',
+    '.json': 'json',
+    '.txt': 'text',
+    '.text': 'text',
+}
+
+# orjson option flags for compact and pretty-printed output, built once
+_JSON_COMPACT_OPTIONS = orjson.OPT_NON_STR_KEYS
+_JSON_PRETTY_OPTIONS = _JSON_COMPACT_OPTIONS | orjson.OPT_INDENT_2
+
+# Leading bytes identifying binary spreadsheet containers
+_ZIP_MAGIC = b'PK\x03\x04'           # xlsx/xlsm/ods (zip archives)
+_OLE2_MAGIC = b'\xd0\xcf\x11\xe0'     # legacy xls (OLE2 compound file)
+
+# Number of leading bytes inspected when sniffing file content
+_SNIFF_BYTES = 4096
+
+# CSV/TSV files larger than this are read with sampled dtypes
+_LARGE_CSV_BYTES = 50_000_000
+
+# Number of rows sampled to choose dtypes for large CSV/TSV files
+_DTYPE_SAMPLE_ROWS = 10_000
+
+# Chunk size used when scanning worksheet XML for merged cells
+_SCAN_CHUNK_BYTES = 64 * 1024
+
+# Cell strings read as missing values, matching pandas' default na_values
+_NA_STRINGS = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+})
+
+
+def _df_to_records(df: 'pd.DataFrame') -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame to a list of row dictionaries.
+
+    Faster equivalent of ``df.to_dict(orient='records')``: rows are
+    iterated as plain tuples of native Python values and zipped with the
+    column names, avoiding pandas' per-row overhead.
+
+    Args:
+        df: DataFrame to convert
+
+    Returns:
+        List of dictionaries, one per row
+    """
+    cols = tuple(df.columns)
+    # itertuples walks each column separately, so every column keeps its
+    # own type and no full 2-D object array is materialised
+    return [dict(zip(cols, row)) for row in df.itertuples(index=False, name=None)]
+
+
+def _pyarrow_csv() -> Any:
+    """
+    Import pyarrow's CSV module if pyarrow is installed.
+
+    Returns:
+        The ``pyarrow.csv`` module, or None if pyarrow is not available
+    """
+    try:
+        import pyarrow.csv as pacsv
+    except ImportError:  # pyarrow is optional; fall back to pandas
+        return None
+    return pacsv
+
+
+def _polars() -> Any:
+    """
+    Import polars if it is installed.
+
+    Returns:
+        The ``polars`` module, or None if polars is not available
+    """
+    try:
+        import polars
+    except ImportError:  # polars is optional; fall back to the default readers
+        return None
+    return polars
+
+
+def _read_delimited(
+    file_path: str, delimiter: str, backend: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Read a delimited text file (CSV/TSV) into a list of row dictionaries.
+
+    With ``backend='polars'`` and polars installed, the file is parsed by
+    polars and converted to records in Rust, with the same column names
+    and missing values as the pandas reader. Blank lines are skipped by
+    dropping rows whose fields are all missing, so unlike pandas, rows
+    such as ``,,`` are dropped too. Otherwise pyarrow's
+    multi-threaded CSV reader is used when it is installed, which builds
+    the records directly without an intermediate DataFrame. Failing both,
+    falls back to pandas.
+
+    Args:
+        file_path: Path to the input file
+        delimiter: Field delimiter character
+        backend: Optional fast reader to use ('polars')
+
+    Returns:
+        List of dictionaries, one per row
+    """
+    if backend == 'polars':
+        pl = _polars()
+        if pl is not None:
+            df = pl.read_csv(
+                file_path,
+                separator=delimiter,
+                # Infer types from the whole column, as pandas does, so a
+                # late non-numeric value can't break a numeric guess
+                infer_schema_length=None,
+                null_values=list(_NA_STRINGS),
+            )
+            # polars reads blank lines as all-null rows, where pandas and
+            # pyarrow skip them
+            df = df.filter(~pl.all_horizontal(pl.all().is_null()))
+            # Rename duplicate and blank headers the way pandas does
+            header = _csv_header(file_path, delimiter)
+            if len(header) == df.width:
+                df.columns = _unique_headers(header)
+            return df.to_dicts()
+    
+    pacsv = _pyarrow_csv()
+    if pacsv is not None:
+        return _read_delimited_pyarrow(pacsv, file_path, delimiter)
+
+    import pandas as pd
+    
+    dtype = None
+    if os.path.getsize(file_path) > _LARGE_CSV_BYTES:
+        dtype = _sample_dtypes(file_path, delimiter)
+    df = pd.read_csv(file_path, sep=delimiter, dtype=dtype)
+    return _df_to_records(df)
+
+
+def _csv_header(file_path: str, delimiter: str) -> List[Optional[str]]:
+    """
+    Read the header row of a delimited text file.
+
+    Args:
+        file_path: Path to the input file
+        delimiter: Field delimiter character
+
+    Returns:
+        Column names as written in the file, with None for blank ones
+    """
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        header = next(csv.reader(f, delimiter=delimiter), [])
+    return [name or None for name in header]
+
+
+def _read_delimited_pyarrow(
+    pacsv: Any, file_path: str, delimiter: str
+) -> List[Dict[str, Any]]:
+    """
+    Read a delimited text file into row dictionaries with pyarrow.
+
+    Column names follow the pandas reader: duplicate and blank headers are
+    renamed the way pandas does. Date/time columns are kept as the
+    original strings rather than parsed into datetimes. Unlike pandas,
+    integer columns with blanks stay integers (pandas reads them as
+    floats).
+
+    Args:
+        pacsv: The ``pyarrow.csv`` module
+        file_path: Path to the input file
+        delimiter: Field delimiter character
+
+    Returns:
+        List of dictionaries, one per row
+    """
+    import pyarrow as pa
+    
+    path = os.fspath(file_path)
+    read_options = pacsv.ReadOptions()
+    header = _csv_header(path, delimiter)
+    if header:
+        # pyarrow keeps duplicate names, which would collapse into one key
+        # per record; supply unique names and skip the header row instead
+        read_options = pacsv.ReadOptions(
+            column_names=_unique_headers(header), skip_rows=1
+        )
+    parse_options = pacsv.ParseOptions(delimiter=delimiter)
+    
+    # Treat empty strings as missing, like pandas does
+    table = pacsv.read_csv(
+        path,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+    )
+    
+    # pandas leaves date/time text alone, but pyarrow always infers it
+    # and can't be told not to; re-read just those columns as strings
+    temporal = [
+        field.name for field in table.schema if pa.types.is_temporal(field.type)
+    ]
+    if temporal:
+        text = pacsv.read_csv(
+            path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=pacsv.ConvertOptions(
+                strings_can_be_null=True,
+                include_columns=temporal,
+                column_types={name: pa.string() for name in temporal},
+            ),
+        )
+        for name in temporal:
+            index = table.schema.get_field_index(name)
+            table = table.set_column(index, name, text.column(name))
+    
+    return table.to_pylist()
+
+
+def _sample_dtypes(file_path: str, delimiter: str) -> Dict[str, str]:
+    """
+    Choose memory-saving dtypes for a large delimited file from a sample.
+
+    Text columns with many repeated values in the first rows are read as
+    ``category``, which stores each distinct string once. Numeric columns
+    are left alone: a sample cannot bound the range of the full column,
+    and narrower floats would change the values written to JSON.
+
+    Args:
+        file_path: Path to the input file
+        delimiter: Field delimiter character
+
+    Returns:
+        Mapping of column name to dtype, suitable for ``pd.read_csv``
+    """
+    import pandas as pd
+    
+    sample = pd.read_csv(file_path, sep=delimiter, nrows=_DTYPE_SAMPLE_ROWS)
+    return {
+        col: 'category'
+        for col in sample.columns
+        if pd.api.types.is_string_dtype(sample[col])
+        and sample[col].nunique() <= len(sample) // 2
+    }
+
+
+def _column_fills(ws: Any) -> Dict[int, List[Tuple[int, int, Any]]]:
+    """
+    Collect the vertical merged cell ranges of a worksheet, grouped by column.
+
+    Only merges spanning a single column are considered. Row bounds are
+    converted to 0-based data row indices (worksheet row 1 holds the
+    headers), and merges starting in the header row are ignored.
+
+    Args:
+        ws: openpyxl worksheet
+
+    Returns:
+        Mapping of 0-based column index to a list of
+        (start_row, stop_row, value) fills, with stop_row exclusive
+    """
+    col_fills: Dict[int, List[Tuple[int, int, Any]]] = {}
+    # Snapshot each range's bounds once as plain ints:
+    # (min_col, min_row, max_col, max_row)
+    bounds = [merged_range.bounds for merged_range in ws.merged_cells.ranges]
+    for min_col, min_row, max_col, max_row in bounds:
+        # Only column-wise merges (same column, multiple rows) with a value
+        if min_col != max_col or min_row < 2:
+            continue
+        value = ws.cell(row=min_row, column=min_col).value
+        if value is None:
+            continue
+        col_fills.setdefault(min_col - 1, []).append((min_row - 2, max_row - 1, value))
+    return col_fills
+
+
+def _has_merged_cells(file_path: str) -> bool:
+    """
+    Check whether any worksheet of an xlsx workbook contains merged cells.
+
+    Streams each worksheet's XML out of the zip archive in chunks looking
+    for a ``mergeCell`` element, which is much cheaper than a full parse.
+
+    Args:
+        file_path: Path to the workbook
+
+    Returns:
+        True if merged cells may be present, False if there are none
+    """
+    needle = b'mergeCell'
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            for name in archive.namelist():
+                if not (name.startswith('xl/worksheets/') and name.endswith('.xml')):
+                    continue
+                with archive.open(name) as f:
+                    tail = b''
+                    while True:
+                        chunk = f.read(_SCAN_CHUNK_BYTES)
+                        if not chunk:
+                            break
+                        # Keep the end of the previous chunk so a tag split
+                        # across chunk boundaries is still found
+                        if needle in tail + chunk:
+                            return True
+                        tail = chunk[-(len(needle) - 1):]
+    except zipfile.BadZipFile:
+        # Not an xlsx archive; let openpyxl decide how to handle it
+        return True
+    return False
+
+
+def _unique_headers(header_row: Sequence[Any]) -> List[Any]:
+    """
+    Build column names from a header row.
+
+    Mirrors pandas: blank headers become ``'Unnamed: <index>'`` and
+    repeated names get a ``.1``, ``.2``, ... suffix so no column is lost.
+
+    Args:
+        header_row: Values of the header row, with None for blank cells
+
+    Returns:
+        List of unique column names
+    """
+    headers = []
+    seen: Dict[Any, int] = {}
+    for idx, name in enumerate(header_row):
+        if name is None:
+            name = f'Unnamed: {idx}'
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        headers.append(name)
+    return headers
+
+
+def _filled_width(row: Sequence[Any]) -> int:
+    """
+    Return the length of a worksheet row without its trailing empty cells.
+
+    Args:
+        row: Cell values of the row
+
+    Returns:
+        Number of cells up to and including the last non-empty one
+    """
+    width = len(row)
+    while width and (row[width - 1] is None or row[width - 1] == ''):
+        width -= 1
+    return width
+
+
+def _read_sheet(ws: Any) -> List[Dict[str, Any]]:
+    """
+    Read a worksheet into a list of row dictionaries.
+
+    The first row is used as headers. Values of vertically merged cells
+    are propagated to every row of the merge, and trailing empty rows are
+    dropped. As with pandas.read_excel, strings such as ``'NA'`` or
+    ``'#N/A'`` are read as missing values.
+
+    Args:
+        ws: openpyxl worksheet
+
+    Returns:
+        List of dictionaries, one per data row
+    """
+    if ws.parent.read_only:
+        # Read-only mode trusts the sheet's stored dimensions, which some
+        # writers get wrong; read every row that is actually present
+        ws.reset_dimensions()
+    rows = ws.iter_rows(values_only=True)
+    header_row = next(rows, None)
+    if header_row is None:
+        return []
+    # After reset_dimensions openpyxl yields missing rows as empty lists
+    header_row = tuple(header_row)
+    body = list(rows)
+    
+    # Trim trailing empty rows, as pandas does; empty rows in the middle
+    # of the sheet are kept so records line up with worksheet rows. This
+    # happens before merged cells are filled so that a merge running past
+    # the last data row can't add records.
+    end = len(body)
+    while end and not _filled_width(body[end - 1]):
+        end -= 1
+    del body[end:]
+    
+    # Like pandas, ignore trailing cells that are empty in every row (e.g.
+    # styled but blank). Read-only worksheets with unknown dimensions yield
+    # ragged rows, so shorter rows are padded to this common width below.
+    width = max(_filled_width(header_row), max(map(_filled_width, body), default=0))
+    headers = _unique_headers(
+        header_row[:width] + (None,) * (width - len(header_row))
+    )
+    
+    # Read-only workbooks are only used when there are no merged cells
+    col_fills = {} if ws.parent.read_only else _column_fills(ws)
+    
+    # openpyxl's row tuples are used as-is unless they need padding or
+    # merged cell values written into them
+    if col_fills or any(len(row) < width for row in body):
+        body = [list(row) + [None] * (width - len(row)) for row in body]
+        for col_idx, fills in col_fills.items():
+            # Skip if the column index is out of bounds for our rows
+            if col_idx >= width:
+                continue
+            # Slicing clips each fill to the trimmed rows
+            for row_start, row_stop, value in fills:
+                for row in body[row_start:row_stop]:
+                    row[col_idx] = value
+    
+    return [
+        {
+            header: None if type(value) is str and value in _NA_STRINGS else value
+            for header, value in zip(headers, row)
+        }
+        for row in body
+    ]
 
 
 def detect_file_type(file_path: str) -> str:
@@ -19,139 +459,190 @@ def detect_file_type(file_path: str) -> str:
     Returns:
         String representing the detected file type
     """
-    extension = os.path.splitext(file_path)[1].lower()
+    path = os.fspath(file_path)
+    dot = path.rfind('.')
+    # A "suffix" that is really part of a directory name (or missing) just
+    # won't match any known extension and falls through to content sniffing
+    extension = path[dot:].lower() if dot >= 0 else ''
     
-    # Check by extension first
-    if extension in ['.xlsx', '.xls', '.xlsm', '.xlsb', '.odf', '.ods', '.odt']:
+    # Check by extension first, then fall back to the content
+    return _EXTENSION_TYPES.get(extension) or _sniff_file_type(file_path)
+
+
+def _is_xlsx_archive(file_path: str) -> bool:
+    """
+    Check whether a zip archive is an Excel workbook.
+
+    Only the archive's central directory is read; xlsx/xlsm workbooks
+    always contain an ``xl/workbook.xml`` member.
+
+    Args:
+        file_path: Path to the zip archive
+
+    Returns:
+        True if the archive is an Excel workbook
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            archive.getinfo('xl/workbook.xml')
+    except (zipfile.BadZipFile, KeyError):
+        return False
+    return True
+
+
+def _sniff_file_type(file_path: str) -> str:
+    """
+    Infer file type from the first few kilobytes of content.
+
+    Binary spreadsheets are recognised by their magic bytes (zip archives
+    must also contain a workbook); text is passed to csv.Sniffer to choose
+    between comma and tab delimiters.
+
+    Args:
+        file_path: Path to the input file
+
+    Returns:
+        String representing the detected file type
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(_SNIFF_BYTES)
+    except OSError:
+        # Missing, unreadable or not a regular file (e.g. a directory)
+        return 'unknown'
+
+    if head.startswith(_ZIP_MAGIC):
+        return 'excel' if _is_xlsx_archive(file_path) else 'unknown'
+    if head.startswith(_OLE2_MAGIC):
         return 'excel'
-    elif extension == '.csv':
+    if not head or b'\x00' in head:
+        # Empty or binary content we don't know how to read
+        return 'unknown'
+
+    text = head.decode('utf-8', errors='replace')
+    # Drop a trailing partial line so the sniffer only sees whole rows
+    if '\n' in text:
+        text = text[:text.rindex('\n')]
+    try:
+        dialect = csv.Sniffer().sniff(text, delimiters=',\t')
+    except csv.Error:
+        # No consistent delimiter, e.g. a single-column file
         return 'csv'
-    elif extension == '.tsv':
-        return 'tsv'
-    elif extension == '.json':
-        return 'json'
-    elif extension in ['.txt', '.text']:
-        return 'text'
-    else:
-        # Try to infer from content
-        try:
-            # Try reading as CSV first
-            pd.read_csv(file_path, nrows=5)
-            return 'csv'
-        except Exception:
-            try:
-                # Try reading as TSV
-                pd.read_csv(file_path, sep='\t', nrows=5)
-                return 'tsv'
-            except Exception:
-                try:
-                    # Try reading as Excel
-                    pd.read_excel(file_path, nrows=5)
-                    return 'excel'
-                except Exception:
-                    return 'unknown'
-
-
-def read_file(file_path: str, file_type: Optional[str] = None) -> Any:
+    return 'tsv' if dialect.delimiter == '\t' else 'csv'
+
+
+def read_file(
+    file_path: str, file_type: Optional[str] = None, backend: Optional[str] = None
+) -> Any:
     """
     Read file based on detected or specified type.
     
     Args:
         file_path: Path to the input file
         file_type: Optional file type to force (excel, csv, tsv, json, text)
+        backend: Optional fast reader for CSV/TSV files (polars); the
+            default readers are used if it is not installed
         
     Returns:
         Python object representation of the file content
         
     Raises:
-        ValueError: If file type is unsupported or undetected
+        ValueError: If file type is unsupported or undetected, or the
+            backend is unknown
     """
+    if backend not in (None, 'polars'):
+        raise ValueError(f"Unsupported backend: {backend}")
+    
     if not file_type:
         file_type = detect_file_type(file_path)
     
     if file_type == 'excel':
-        # Read all sheets
-        excel_file = pd.ExcelFile(file_path)
-        data = {}
-        
-        # Use openpyxl to get merged cell information
+        # Load the workbook once with openpyxl; it provides both the cell
+        # values and the merged cell information. Merged cells are only
+        # available from a full load, so use the much cheaper streaming
+        # read-only mode when the workbook has none.
         import openpyxl
-        wb = openpyxl.load_workbook(file_path, data_only=True)
+        read_only = not _has_merged_cells(file_path)
+        wb = openpyxl.load_workbook(file_path, read_only=read_only, data_only=True)
         
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-            
-            # Process merged cells for this sheet
-            if sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                
-                # Get all merged cell ranges
-                merged_cells = ws.merged_cells.ranges
-                
-                # Handle merged cells that span rows
-                for merged_range in merged_cells:
-                    # Get merged cell value (from top-left cell)
-                    top_left_cell = ws.cell(row=merged_range.min_row, column=merged_range.min_col)
-                    if top_left_cell.value is None:
-                        continue
-                    
-                    # Only process if this is a column-wise merge (same column, multiple rows)
-                    if merged_range.min_col == merged_range.max_col:
-                        col_idx = merged_range.min_col - 1  # Convert to 0-based indexing
-                        
-                        # Skip if the column index is out of bounds for our dataframe
-                        if col_idx >= len(df.columns):
-                            continue
-                        
-                        col_name = df.columns[col_idx]
-                        
-                        # For each row in the merged range, apply the value
-                        for row_idx in range(merged_range.min_row - 1, merged_range.max_row):
-                            # Skip if row index is out of bounds
-                            if row_idx >= len(df):
-                                continue
-                            
-                            # Apply the merged cell value to this row
-                            df.at[row_idx, col_name] = top_left_cell.value
-            
-            data[sheet_name] = df.to_dict(orient='records')
-        return data
+        try:
+            # Read all sheets (chartsheets have no cells and are skipped)
+            return {ws.title: _read_sheet(ws) for ws in wb.worksheets}
+        finally:
+            wb.close()
     
     elif file_type == 'csv':
-        df = pd.read_csv(file_path)
-        return df.to_dict(orient='records')
+        return _read_delimited(file_path, ',', backend)
     
     elif file_type == 'tsv':
-        df = pd.read_csv(file_path, sep='\t')
-        return df.to_dict(orient='records')
+        return _read_delimited(file_path, '\t', backend)
     
     elif file_type == 'json':
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+                # Pipes, FIFOs and empty files can't be mapped; read them
+                return orjson.loads(f.read())
+            # Parse straight from the memory-mapped file, without copying
+            # it into an intermediate read buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
     
     elif file_type == 'text':
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        return {"lines": [line.rstrip('\n') for line in lines]}
+            lines = f.read().split('\n')
+        # A trailing newline terminates the last line rather than starting
+        # a new, empty one
+        if lines[-1] == '':
+            lines.pop()
+        return {"lines": lines}
     
     else:
         raise ValueError(f"Unsupported or undetected file type for {file_path}")
 
 
-def convert_to_json(data: Any, output_path: Optional[str] = None) -> str:
+def _write_bytes(output_path: str, payload: bytes) -> None:
+    """
+    Write a prebuilt buffer to a file with raw os.write calls.
+
+    Bypasses the buffered file object; the kernel may accept only part of
+    a large buffer per call, so the write is repeated until it's all out.
+
+    Args:
+        output_path: Path of the file to create or truncate
+        payload: Bytes to write
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(output_path, flags, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def convert_to_json(
+    data: Any, output_path: Optional[str] = None, compact: bool = False
+) -> str:
     """
     Convert data to JSON and optionally save to file.
     
     Args:
         data: Python object to convert to JSON
         output_path: Optional path to save JSON output
+        compact: Emit compact JSON without indentation
         
     Returns:
         JSON string or confirmation message if saved to file
     """
+    # orjson encodes the whole document into a single UTF-8 buffer in C,
+    # instead of the many small writes json.dump issues per token.
+    option = _JSON_COMPACT_OPTIONS if compact else _JSON_PRETTY_OPTIONS
+    payload = orjson.dumps(data, option=option)
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _write_bytes(output_path, payload)
         return f"JSON saved to {output_path}"
     else:
-        return json.dumps(data, indent=2, ensure_ascii=False)
\ No newline at end of file
+        return payload.decode('utf-8')
\ No newline at end of file
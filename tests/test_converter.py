@@ -4,7 +4,11 @@ Tests for the file2json converter module.
 
 import json
 import os
+import re
+import subprocess
+import sys
 import tempfile
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -71,6 +75,28 @@ def test_detect_file_type(test_files):
     assert detect_file_type(test_files['json']) == 'json'
 
 
+def test_detect_file_type_by_content(test_files):
+    """Test file type detection from content when the extension is unknown."""
+    tmp_dir = Path(test_files['temp_dir'])
+    for file_type in ['csv', 'tsv', 'excel']:
+        unknown_path = tmp_dir / f"{file_type}.dat"
+        unknown_path.write_bytes(test_files[file_type].read_bytes())
+        assert detect_file_type(unknown_path) == file_type
+
+    zip_path = tmp_dir / "archive.dat"
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        archive.writestr('readme.txt', 'not a workbook')
+    assert detect_file_type(zip_path) == 'unknown'
+
+    empty_path = tmp_dir / "empty.dat"
+    empty_path.write_bytes(b"")
+    assert detect_file_type(empty_path) == 'unknown'
+
+    # Paths that can't be read as files are unknown rather than errors
+    assert detect_file_type(tmp_dir / "missing.dat") == 'unknown'
+    assert detect_file_type(tmp_dir) == 'unknown'
+
+
 def test_read_file_csv(test_files):
     """Test reading CSV files."""
     data = read_file(test_files['csv'])
@@ -103,6 +129,108 @@ def test_read_file_excel(test_files):
     assert data['Sheet2'][0]['product'] == 'Laptop'
 
 
+def test_read_file_large_csv(test_files, monkeypatch):
+    """Test the sampled-dtype pandas path used for large CSV files."""
+    from file2json import converter
+
+    monkeypatch.setattr(converter, '_pyarrow_csv', lambda: None)
+    monkeypatch.setattr(converter, '_LARGE_CSV_BYTES', 0)
+
+    csv_path = Path(test_files['temp_dir']) / "large.csv"
+    pd.DataFrame({
+        'city': ['Paris', 'Paris', 'London', None] * 5,
+        'name': [f"person {i}" for i in range(20)],
+        'count': [1, 2, 3, 4] * 5,
+    }).to_csv(csv_path, index=False)
+
+    # Only the repetitive text column is read as category; mostly unique
+    # text and numeric columns keep their default dtypes
+    assert converter._sample_dtypes(csv_path, ',') == {'city': 'category'}
+
+    data = read_file(csv_path)
+    assert len(data) == 20
+    assert data[0] == {'city': 'Paris', 'name': 'person 0', 'count': 1}
+    assert data[2] == {'city': 'London', 'name': 'person 2', 'count': 3}
+    assert pd.isna(data[3]['city'])
+
+
+def test_read_file_polars_backend(test_files):
+    """Test reading CSV and TSV files with the polars backend."""
+    pytest.importorskip('polars')
+    for file_type in ['csv', 'tsv']:
+        data = read_file(test_files[file_type], backend='polars')
+        assert data == read_file(test_files[file_type])
+
+    # Late non-numeric values, duplicate headers and NA strings
+    csv_path = Path(test_files['temp_dir']) / "polars.csv"
+    rows = [f"{i},{i},NA" for i in range(200)] + ["n/a-text,1,x"]
+    csv_path.write_text("a,a,b\n" + "\n".join(rows) + "\n")
+    data = read_file(csv_path, backend='polars')
+    assert len(data) == 201
+    assert data[0] == {'a': '0', 'a.1': 0, 'b': None}
+    assert data[-1] == {'a': 'n/a-text', 'a.1': 1, 'b': 'x'}
+
+    # Blank lines are skipped, as the default readers do
+    blank_path = Path(test_files['temp_dir']) / "blank_lines.csv"
+    blank_path.write_text("a,b\n1,2\n\n3,4\n")
+    assert read_file(blank_path, backend='polars') == [
+        {'a': 1, 'b': 2},
+        {'a': 3, 'b': 4},
+    ]
+
+    with pytest.raises(ValueError):
+        read_file(test_files['csv'], backend='unknown')
+
+
+def test_read_file_pyarrow_csv(test_files):
+    """Test that the pyarrow CSV reader matches the pandas reader's output."""
+    pytest.importorskip('pyarrow')
+    csv_path = Path(test_files['temp_dir']) / "pyarrow.csv"
+    csv_path.write_text(
+        "a,a,,when\n"
+        "1,2,x,2020-01-01T10:00:00\n"
+        "3,4,,2021-06-30\n"
+    )
+    
+    assert read_file(csv_path) == [
+        {'a': 1, 'a.1': 2, 'Unnamed: 2': 'x', 'when': '2020-01-01T10:00:00'},
+        {'a': 3, 'a.1': 4, 'Unnamed: 2': None, 'when': '2021-06-30'},
+    ]
+
+
+def test_read_file_excel_many_sheets(test_files):
+    """Test that sheets of a multi-sheet workbook keep their order."""
+    import openpyxl
+    excel_path = Path(test_files['temp_dir']) / "sheets.xlsx"
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    names = [f"S{k}" for k in range(10, 0, -1)]
+    for k, name in enumerate(names):
+        ws = wb.create_sheet(name)
+        ws.append(['row', 'sheet'])
+        for i in range(50):
+            ws.append([i, k])
+    wb.save(excel_path)
+    
+    data = read_file(excel_path)
+    assert list(data) == names
+    for k, name in enumerate(names):
+        assert data[name] == [{'row': i, 'sheet': k} for i in range(50)]
+
+
+def test_read_file_excel_chartsheets_only(test_files):
+    """Test reading a workbook that has chartsheets but no worksheets."""
+    import openpyxl
+    excel_path = Path(test_files['temp_dir']) / "charts.xlsx"
+    from openpyxl.chart import BarChart
+    wb = openpyxl.Workbook()
+    wb.create_chartsheet('Chart').add_chart(BarChart())
+    wb.remove(wb.active)
+    wb.save(excel_path)
+    
+    assert read_file(excel_path) == {}
+
+
 def test_read_file_text(test_files):
     """Test reading text files."""
     data = read_file(test_files['text'])
@@ -124,6 +252,47 @@ def test_read_file_json(test_files):
     assert data[2]['name'] == 'Charlie'
 
 
+def test_json_and_text_skip_pandas_import(test_files):
+    """Test that JSON and text conversion never import pandas."""
+    code = (
+        "import sys\n"
+        "from file2json.converter import read_file, convert_to_json\n"
+        f"convert_to_json(read_file({str(test_files['json'])!r}))\n"
+        f"convert_to_json(read_file({str(test_files['text'])!r}))\n"
+        "assert 'pandas' not in sys.modules\n"
+    )
+    repo_root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=repo_root)
+
+
+def test_read_file_json_empty(test_files):
+    """Test that an empty JSON file raises a decode error."""
+    empty_path = Path(test_files['temp_dir']) / "empty.json"
+    empty_path.write_bytes(b"")
+    with pytest.raises(json.JSONDecodeError):
+        read_file(empty_path)
+
+
+@pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason="requires os.mkfifo")
+def test_read_file_json_fifo(test_files):
+    """Test reading JSON from a non-regular file such as a FIFO."""
+    import threading
+    fifo_path = Path(test_files['temp_dir']) / "pipe"
+    os.mkfifo(fifo_path)
+    
+    def write_json():
+        with open(fifo_path, 'wb') as f:
+            f.write(Path(test_files['json']).read_bytes())
+    
+    writer = threading.Thread(target=write_json)
+    writer.start()
+    try:
+        data = read_file(fifo_path, 'json')
+    finally:
+        writer.join()
+    assert [row['name'] for row in data] == ['Alice', 'Bob', 'Charlie']
+
+
 def test_convert_to_json_string():
     """Test converting data to JSON string."""
     data = [{'name': 'Alice', 'age': 25}]
@@ -132,6 +301,14 @@ def test_convert_to_json_string():
     assert json.loads(json_str) == data
 
 
+def test_convert_to_json_compact():
+    """Test converting data to compact JSON."""
+    data = [{'name': 'Alice', 'age': 25}]
+    json_str = convert_to_json(data, compact=True)
+    assert json_str == '[{"name":"Alice","age":25}]'
+    assert json.loads(json_str) == data
+
+
 def test_convert_to_json_file(test_files):
     """Test converting data to JSON file."""
     data = [{'name': 'Alice', 'age': 25}]
@@ -226,4 +403,130 @@ def test_merged_cells_excel():
         
     finally:
         # Clean up
-        os.unlink(temp_path)
\ No newline at end of file
+        os.unlink(temp_path)
+
+
+def test_merged_cells_past_last_row():
+    """Test that a merge extending below the data doesn't add records."""
+    import openpyxl
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        excel_path = Path(tmp_dir) / "merge_tail.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['cat', 'v'])
+        ws.append(['A', 1])
+        ws.append([None, 2])
+        ws.merge_cells('A2:A6')
+        wb.save(excel_path)
+        
+        data = read_file(excel_path)['Sheet']
+        assert data == [{'cat': 'A', 'v': 1}, {'cat': 'A', 'v': 2}]
+
+
+def test_read_file_excel_styled_empty_cells(test_files):
+    """Test that styled but empty cells don't add columns."""
+    import openpyxl
+    from openpyxl.styles import PatternFill
+    excel_path = Path(test_files['temp_dir']) / "styled.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['a', 'b'])
+    ws.append([1, 2])
+    ws['E1'].fill = PatternFill(fill_type='solid', fgColor='FFFF00')
+    ws['E3'].fill = PatternFill(fill_type='solid', fgColor='FFFF00')
+    wb.save(excel_path)
+    
+    data = read_file(excel_path)['Sheet']
+    assert data == [{'a': 1, 'b': 2}]
+
+
+def _rewrite_dimension(path, ref):
+    """Rewrite the stored <dimension> of the first sheet, or drop it if ref is None."""
+    with zipfile.ZipFile(path) as src:
+        members = {info.filename: src.read(info) for info in src.infolist()}
+    
+    sheet = 'xl/worksheets/sheet1.xml'
+    replacement = b'' if ref is None else f'<dimension ref="{ref}" />'.encode()
+    members[sheet] = re.sub(rb'<dimension ref="[^"]*" />', replacement, members[sheet])
+    
+    with zipfile.ZipFile(path, 'w') as dst:
+        for name, content in members.items():
+            dst.writestr(name, content)
+
+
+def test_read_file_excel_layout(test_files):
+    """Test header naming, empty rows and missing-value strings in Excel sheets."""
+    import openpyxl
+    excel_path = Path(test_files['temp_dir']) / "layout.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['a', None, 'a', 'b'])
+    ws.append([1, 2, 3, 'NA'])
+    ws.append([])
+    ws.append([4, 5, 6, '#N/A'])
+    ws.append([None, None, None, ''])
+    wb.save(excel_path)
+    
+    data = read_file(excel_path)['Sheet']
+    
+    # Blank headers become 'Unnamed: i' and duplicates get a suffix;
+    # the empty middle row is kept and the trailing one is trimmed
+    assert data == [
+        {'a': 1, 'Unnamed: 1': 2, 'a.1': 3, 'b': None},
+        {'a': None, 'Unnamed: 1': None, 'a.1': None, 'b': None},
+        {'a': 4, 'Unnamed: 1': 5, 'a.1': 6, 'b': None},
+    ]
+
+
+def test_read_file_excel_ragged_rows(test_files):
+    """Test that ragged rows from sheets without stored dimensions are padded."""
+    import openpyxl
+    excel_path = Path(test_files['temp_dir']) / "ragged.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['a', 'b'])
+    ws.append([1])
+    ws.append([2, 3, 4])
+    wb.save(excel_path)
+    _rewrite_dimension(excel_path, None)
+    
+    data = read_file(excel_path)['Sheet']
+    assert data == [
+        {'a': 1, 'b': None, 'Unnamed: 2': None},
+        {'a': 2, 'b': 3, 'Unnamed: 2': 4},
+    ]
+
+
+def test_read_file_excel_stale_dimension(test_files):
+    """Test that a wrong stored sheet dimension doesn't truncate the data."""
+    import openpyxl
+    excel_path = Path(test_files['temp_dir']) / "stale.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(['a', 'b'])
+    for i in range(5):
+        ws.append([i, i * 10])
+    wb.save(excel_path)
+    _rewrite_dimension(excel_path, 'A1:B2')
+    
+    data = read_file(excel_path)['Sheet']
+    assert data == [{'a': i, 'b': i * 10} for i in range(5)]
+
+
+def test_read_file_excel_blank_first_row(test_files):
+    """Test reading a sheet whose first row is blank."""
+    import openpyxl
+    excel_path = Path(test_files['temp_dir']) / "blank_first.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws['A2'] = 'h1'
+    ws['B2'] = 'h2'
+    ws['A3'] = 1
+    ws['B3'] = 2
+    wb.save(excel_path)
+    
+    data = read_file(excel_path)['Sheet']
+    assert data == [
+        {'Unnamed: 0': 'h1', 'Unnamed: 1': 'h2'},
+        {'Unnamed: 0': 1, 'Unnamed: 1': 2},
+    ]